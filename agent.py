@@ -21,16 +21,57 @@ Key Concepts Demonstrated:
 """
 
 import os
+import re
+import atexit
+import queue
+import asyncio
+import argparse
+import sqlite3
+import threading
+import types
+import weakref
 import logging
+import logging.handlers
 import json
+import heapq
+from collections import Counter, OrderedDict, deque
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
-from typing import Dict, List, Any
+from time import time_ns
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Dict, List, Any, Protocol, Set
 
-# Configure logging for observability
+try:
+    import ahocorasick  # Optional: pyahocorasick for single-pass query routing
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # Optional: faster response serialization
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # Optional: vectorized batch resume scoring
+except ImportError:
+    np = None
+
+# Configure logging for observability. Log calls only enqueue records; a
+# background QueueListener does the formatting and stderr I/O.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# QueueHandler only merges args into the message; the listener applies the real format
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[_queue_handler]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -38,153 +79,821 @@ logger = logging.getLogger(__name__)
 # MEMORY MANAGEMENT - Tracks student progress and preferences
 #====================================================================================
 
-class StudentMemoryBank:
-    """Memory Bank to track student progress and preferences"""
+def _fmt_ts(ns: int) -> str:
+    """Format a time_ns() timestamp as ISO 8601; only done when serializing out"""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+
+class ProgressEntry:
+    """Slotted progress record, recycled through StudentMemoryBank's entry pool"""
+    
+    __slots__ = ('activity', 'details', 'timestamp_ns')
+    
+    def __init__(self, activity: str = None, details: Dict = None, timestamp_ns: int = 0):
+        self.activity = activity
+        self.details = details
+        self.timestamp_ns = timestamp_ns
+    
+    def to_dict(self) -> Dict:
+        return {
+            'activity': self.activity,
+            'details': self.details,
+            'timestamp': _fmt_ts(self.timestamp_ns)
+        }
+
+
+class EvictionPolicy(Protocol):
+    """Decides which student StudentMemoryBank drops when it is full"""
+    
+    def on_hit(self, key: str) -> None: ...
+    
+    def on_insert(self, key: str) -> None: ...
+    
+    def evict(self) -> str: ...
+    
+    def stats(self) -> Dict: ...
+
+
+class LRUPolicy:
+    """Evicts the least recently used student"""
+    
+    __slots__ = ('_order', 'hits', 'inserts', 'evictions')
     
     def __init__(self):
+        self._order = OrderedDict()
+        self.hits = self.inserts = self.evictions = 0
+    
+    def on_hit(self, key: str) -> None:
+        self.hits += 1
+        self._order.move_to_end(key)
+    
+    def on_insert(self, key: str) -> None:
+        self.inserts += 1
+        self._order[key] = None
+    
+    def evict(self) -> str:
+        self.evictions += 1
+        return self._order.popitem(last=False)[0]
+    
+    def stats(self) -> Dict:
+        return {'policy': 'lru', 'hits': self.hits, 'inserts': self.inserts, 'evictions': self.evictions}
+
+
+class LFUPolicy:
+    """Evicts the least frequently used student; ties go to the least recently touched one"""
+    
+    __slots__ = ('_counts', '_heap', '_seq', 'hits', 'inserts', 'evictions')
+    
+    def __init__(self):
+        self._counts = Counter()
+        # (count, seq, key) entries, seq bumped on every insert and hit; stale
+        # entries are skipped lazily in evict()
+        self._heap = []
+        self._seq = 0
+        self.hits = self.inserts = self.evictions = 0
+    
+    def _push(self, key: str):
+        self._seq += 1
+        heapq.heappush(self._heap, (self._counts[key], self._seq, key))
+        if len(self._heap) > 2 * len(self._counts) + 64:
+            # Drop stale entries so the heap stays proportional to the key count
+            self._heap = [entry for entry in self._heap if self._counts.get(entry[2]) == entry[0]]
+            heapq.heapify(self._heap)
+    
+    def on_hit(self, key: str) -> None:
+        self.hits += 1
+        self._counts[key] += 1
+        self._push(key)
+    
+    def on_insert(self, key: str) -> None:
+        self.inserts += 1
+        self._counts[key] = 1
+        self._push(key)
+    
+    def evict(self) -> str:
+        while True:
+            count, _, key = heapq.heappop(self._heap)
+            if self._counts.get(key) == count:
+                del self._counts[key]
+                self.evictions += 1
+                return key
+    
+    def stats(self) -> Dict:
+        return {'policy': 'lfu', 'hits': self.hits, 'inserts': self.inserts, 'evictions': self.evictions}
+
+
+class _CountMinSketch:
+    """4-row count-min sketch with 4-bit (saturating at 15) counters, halved periodically"""
+    
+    __slots__ = ('_rows', '_width', '_additions', '_sample_size')
+    
+    def __init__(self, width: int = 1024):
+        self._width = width
+        self._rows = [bytearray(width) for _ in range(4)]
+        self._additions = 0
+        self._sample_size = 10 * width
+    
+    def _indexes(self, key: str):
+        return [hash((seed, key)) % self._width for seed in range(4)]
+    
+    def add(self, key: str):
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            # Aging: halve every counter so old popularity fades out
+            self._rows = [bytearray(count >> 1 for count in row) for row in self._rows]
+            self._additions //= 2
+    
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+
+class TinyLFUPolicy:
+    """Window TinyLFU: a small LRU admission window in front of a frequency-filtered main LRU
+    
+    New students enter the window. When the bank is full, the window's oldest
+    student only displaces the main region's oldest if the sketch estimates
+    it has been accessed more often.
+    """
+    
+    __slots__ = ('_window', '_main', '_sketch', '_window_fraction', 'hits', 'inserts', 'evictions')
+    
+    def __init__(self, window_fraction: float = 0.01, sketch_width: int = 1024):
+        self._window = OrderedDict()
+        self._main = OrderedDict()
+        self._sketch = _CountMinSketch(sketch_width)
+        self._window_fraction = window_fraction
+        self.hits = self.inserts = self.evictions = 0
+    
+    def _window_cap(self) -> int:
+        return max(1, int((len(self._window) + len(self._main)) * self._window_fraction))
+    
+    def on_hit(self, key: str) -> None:
+        self.hits += 1
+        self._sketch.add(key)
+        if key in self._window:
+            self._window.move_to_end(key)
+        else:
+            self._main.move_to_end(key)
+    
+    def on_insert(self, key: str) -> None:
+        self.inserts += 1
+        self._sketch.add(key)
+        self._window[key] = None
+        while len(self._window) > self._window_cap():
+            self._main[self._window.popitem(last=False)[0]] = None
+    
+    def evict(self) -> str:
+        self.evictions += 1
+        if not self._main:
+            return self._window.popitem(last=False)[0]
+        if not self._window:
+            return self._main.popitem(last=False)[0]
+        candidate = next(iter(self._window))
+        victim = next(iter(self._main))
+        if self._sketch.estimate(candidate) > self._sketch.estimate(victim):
+            # Admit the window's candidate into main in place of the victim
+            del self._main[victim]
+            del self._window[candidate]
+            self._main[candidate] = None
+            return victim
+        del self._window[candidate]
+        return candidate
+    
+    def stats(self) -> Dict:
+        return {'policy': 'tinylfu', 'hits': self.hits, 'inserts': self.inserts, 'evictions': self.evictions}
+
+
+EVICTION_POLICIES = {
+    'lru': LRUPolicy,
+    'lfu': LFUPolicy,
+    'tinylfu': TinyLFUPolicy,
+}
+
+
+# Unknown student ids remembered per persistent memory bank
+_MISSING_CACHE_SIZE = 1024
+
+
+class StudentMemoryBank:
+    """Memory Bank to track student progress and preferences
+    
+    At most max_students are kept in memory; which one is dropped when full is
+    decided by the eviction policy (LRUPolicy unless another is given).
+    
+    With db_path set, the in-memory tier becomes a write-through cache over a
+    sqlite3 database in WAL mode: evicted students are reloaded from disk on
+    their next access and everything survives restarts. Progress rows are
+    buffered and written in batches every flush_every updates or
+    flush_interval seconds, whichever comes first.
+    """
+    
+    __slots__ = ('max_students', 'max_progress', 'students', 'policy', '_pool', 'db',
+                 'flush_every', '_write_buf', '_db_lock', '_closed', '_flusher', '_missing')
+    
+    def __init__(self, max_students: int = 10000, max_progress: int = 100, pool_size: int = 1024,
+                 db_path: str = None, flush_every: int = 64, flush_interval: float = 1.0,
+                 policy: EvictionPolicy = None):
+        if max_students < 1:
+            raise ValueError(f"max_students must be at least 1, got {max_students}")
+        if max_progress < 1:
+            raise ValueError(f"max_progress must be at least 1, got {max_progress}")
+        self.max_students = max_students
+        self.max_progress = max_progress
         self.students = {}
+        self.policy = policy if policy is not None else LRUPolicy()
+        # Free-list of ProgressEntry objects; entries dropped from progress logs return here
+        self._pool = deque((ProgressEntry() for _ in range(pool_size)), maxlen=pool_size)
+        self.db = None
+        if db_path is not None:
+            self._open_db(db_path, flush_every, flush_interval)
         logger.info("Memory Bank initialized")
     
+    def _open_db(self, db_path: str, flush_every: int, flush_interval: float):
+        self.db = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS students('
+            'id TEXT PRIMARY KEY, profile TEXT, preferences TEXT, created_at_ns INTEGER)'
+        )
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS progress('
+            'seq INTEGER PRIMARY KEY AUTOINCREMENT, student_id TEXT, activity TEXT, '
+            'details TEXT, timestamp_ns INTEGER)'
+        )
+        self.db.execute('CREATE INDEX IF NOT EXISTS progress_student ON progress(student_id, seq)')
+        self.flush_every = flush_every
+        self._write_buf = []
+        # Bounded negative cache of ids known not to be in the database
+        self._missing = OrderedDict()
+        # Guards the write buffer and the connection, shared with the flusher thread
+        self._db_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, args=(flush_interval,),
+                                         name='memory-bank-flusher', daemon=True)
+        self._flusher.start()
+        # The flusher is a daemon thread, so pending rows are written on normal exit here
+        atexit.register(self.close)
+    
+    def _flush_loop(self, interval: float):
+        while not self._closed.wait(interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                # Rows stay buffered; the next tick retries them
+                logger.exception("Background flush of memory bank failed")
+    
+    def _rollback(self):
+        if self.db.in_transaction:
+            self.db.execute('ROLLBACK')
+    
+    def flush(self):
+        """Write buffered progress rows to the database in one transaction
+        
+        On failure the transaction is rolled back, the rows are put back in
+        the buffer for the next flush, and the error is re-raised.
+        """
+        if self.db is None:
+            return
+        with self._db_lock:
+            if not self._write_buf:
+                return
+            rows, self._write_buf = self._write_buf, []
+            try:
+                # IMMEDIATE takes the write lock up front so concurrent writers cannot deadlock
+                self.db.execute('BEGIN IMMEDIATE')
+                self.db.executemany(
+                    'INSERT INTO progress(student_id, activity, details, timestamp_ns) VALUES (?, ?, ?, ?)',
+                    rows
+                )
+                self.db.execute('COMMIT')
+            except sqlite3.Error:
+                self._rollback()
+                self._write_buf = rows + self._write_buf
+                raise
+    
+    def close(self):
+        """Stop the background flusher, write pending rows and close the database"""
+        if self.db is None:
+            return
+        atexit.unregister(self.close)
+        self._closed.set()
+        self._flusher.join()
+        try:
+            self.flush()
+        finally:
+            self.db.close()
+            self.db = None
+    
+    def _release(self, student: Dict):
+        # Drop references so pooled entries do not keep evicted students' details alive
+        for entry in student['progress']:
+            entry.activity = entry.details = None
+        self._pool.extend(student['progress'])
+    
+    def _cache_put(self, student_id: str, student: Dict):
+        if student_id in self.students:
+            self._release(self.students[student_id])
+            self.policy.on_hit(student_id)
+        else:
+            if len(self.students) >= self.max_students:
+                evicted_id = self.policy.evict()
+                self._release(self.students.pop(evicted_id))
+                logger.info("Evicted student: %s", evicted_id)
+            self.policy.on_insert(student_id)
+        self.students[student_id] = student
+    
+    def _take_entry(self, progress: deque) -> ProgressEntry:
+        if len(progress) == progress.maxlen:
+            # Reuse the entry that would be evicted by the bounded deque
+            return progress.popleft()
+        if self._pool:
+            return self._pool.pop()
+        return ProgressEntry()
+    
+    def _load(self, student_id: str) -> Dict:
+        """Hydrate a student evicted from (or never loaded into) memory from disk"""
+        if student_id in self._missing:
+            self._missing.move_to_end(student_id)
+            return None
+        # Students are written synchronously, so existence needs no flush
+        with self._db_lock:
+            exists = self.db.execute('SELECT 1 FROM students WHERE id = ?', (student_id,)).fetchone()
+        if exists is None:
+            self._missing[student_id] = None
+            if len(self._missing) > _MISSING_CACHE_SIZE:
+                self._missing.popitem(last=False)
+            return None
+        self.flush()
+        with self._db_lock:
+            row = self.db.execute(
+                'SELECT profile, preferences, created_at_ns FROM students WHERE id = ?', (student_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            history = self.db.execute(
+                'SELECT activity, details, timestamp_ns FROM progress WHERE student_id = ? '
+                'ORDER BY seq DESC LIMIT ?', (student_id, self.max_progress)
+            ).fetchall()
+        student = {
+            'profile': json.loads(row[0]),
+            'progress': deque(maxlen=self.max_progress),
+            'preferences': json.loads(row[1]),
+            'created_at_ns': row[2]
+        }
+        for activity, details, timestamp_ns in reversed(history):
+            entry = self._take_entry(student['progress'])
+            entry.activity = activity
+            entry.details = json.loads(details)
+            entry.timestamp_ns = timestamp_ns
+            student['progress'].append(entry)
+        self._cache_put(student_id, student)
+        return student
+    
+    def _lookup(self, student_id: str) -> Dict:
+        student = self.students.get(student_id)
+        if student is not None:
+            self.policy.on_hit(student_id)
+        elif self.db is not None:
+            student = self._load(student_id)
+        return student
+    
     def add_student(self, student_id: str, profile: Dict):
-        self.students[student_id] = {
+        student = {
             'profile': profile,
-            'progress': [],
+            'progress': deque(maxlen=self.max_progress),
             'preferences': {},
-            'created_at': datetime.now().isoformat()
+            'created_at_ns': time_ns()
         }
-        logger.info(f"Added student: {student_id}")
+        if self.db is not None:
+            # Write to disk first so a failure leaves the memory tier untouched
+            row = (student_id, json.dumps(profile, default=_json_default),
+                   json.dumps(student['preferences']), student['created_at_ns'])
+            self.flush()
+            with self._db_lock:
+                try:
+                    self.db.execute('BEGIN IMMEDIATE')
+                    # Re-adding a student starts a fresh record, matching the in-memory behaviour
+                    self.db.execute('DELETE FROM progress WHERE student_id = ?', (student_id,))
+                    self.db.execute(
+                        'INSERT OR REPLACE INTO students(id, profile, preferences, created_at_ns) '
+                        'VALUES (?, ?, ?, ?)', row
+                    )
+                    self.db.execute('COMMIT')
+                except sqlite3.Error:
+                    self._rollback()
+                    raise
+            self._missing.pop(student_id, None)
+        self._cache_put(student_id, student)
+        logger.info("Added student: %s", student_id)
     
     def update_progress(self, student_id: str, activity: str, details: Dict):
-        if student_id in self.students:
-            self.students[student_id]['progress'].append({
-                'activity': activity,
-                'details': details,
-                'timestamp': datetime.now().isoformat()
-            })
-            logger.info(f"Updated progress for {student_id}: {activity}")
+        student = self._lookup(student_id)
+        if student is not None:
+            timestamp_ns = time_ns()
+            if self.db is not None:
+                # Serialize before touching memory so bad details cannot desync the tiers
+                row = (student_id, activity, json.dumps(details, default=_json_default), timestamp_ns)
+            progress = student['progress']
+            entry = self._take_entry(progress)
+            entry.activity = activity
+            entry.details = details
+            entry.timestamp_ns = timestamp_ns
+            progress.append(entry)
+            if self.db is not None:
+                with self._db_lock:
+                    self._write_buf.append(row)
+                    pending = len(self._write_buf)
+                if pending >= self.flush_every:
+                    try:
+                        self.flush()
+                    except sqlite3.Error:
+                        # Rows stay buffered and are retried by the next flush
+                        logger.exception("Flush of memory bank failed")
+            logger.info("Updated progress for %s: %s", student_id, activity)
     
     def get_student_context(self, student_id: str) -> Dict:
-        return self.students.get(student_id, {})
+        """Return a JSON-ready copy of the student's record with ISO timestamps
+        
+        The internal record (time_ns() integers, pooled ProgressEntry objects)
+        never leaves the memory bank.
+        """
+        student = self._lookup(student_id)
+        if student is None:
+            return {}
+        return {
+            'profile': student['profile'],
+            'progress': [entry.to_dict() for entry in student['progress']],
+            'preferences': student['preferences'],
+            'created_at': _fmt_ts(student['created_at_ns'])
+        }
 
 
 #====================================================================================
 # CUSTOM TOOLS - Demonstrates custom tool creation
 #====================================================================================
 
+@dataclass(frozen=True)
+class Problem:
+    """Immutable DSA problem record, shared by every recommendation that returns it"""
+    
+    __slots__ = ('name', 'topic', 'difficulty')
+    name: str
+    topic: str
+    difficulty: str
+
+
+@dataclass(frozen=True)
+class Resource:
+    """Immutable learning resource record"""
+    
+    __slots__ = ('title', 'type', 'difficulty')
+    title: str
+    type: str
+    difficulty: str
+
+
+def _json_default(obj):
+    """json.dumps hook for catalog records and progress entries"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, ProgressEntry):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> str:
+    """Serialize a response payload as indented JSON, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2).decode()
+    # ensure_ascii=False matches orjson, which emits raw UTF-8
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def _scan_kernel(buf, offsets, kw_buf, kw_offsets, hits):
+    """Mark hits[i, k] = 1 when keyword k occurs in resume i (byte substring scan)"""
+    n_resumes = offsets.size - 1
+    n_keywords = kw_offsets.size - 1
+    for i in prange(n_resumes):
+        start = offsets[i]
+        end = offsets[i + 1]
+        for k in range(n_keywords):
+            kw_start = kw_offsets[k]
+            kw_len = kw_offsets[k + 1] - kw_start
+            if kw_len == 0 or kw_len > end - start:
+                continue
+            last = kw_buf[kw_start + kw_len - 1]
+            pos = start
+            while pos + kw_len <= end:
+                # Compare the last byte first to skip most candidate windows cheaply
+                if buf[pos + kw_len - 1] == last:
+                    j = 0
+                    while j < kw_len - 1 and buf[pos + j] == kw_buf[kw_start + j]:
+                        j += 1
+                    if j == kw_len - 1:
+                        hits[i, k] = 1
+                        break
+                pos += 1
+
+
+# Rebound to numba.prange when the kernel is compiled; plain range otherwise
+prange = range
+_jit_scan_kernel = None
+
+
+def _get_jit_scan_kernel():
+    """Import numba and JIT-compile _scan_kernel on first use; None if numba is unavailable
+    
+    Deferred so that importing this module (and the numpy batch path) does not
+    pay numba's import cost.
+    """
+    global _jit_scan_kernel, prange
+    if _jit_scan_kernel is None:
+        try:
+            import numba  # Optional: JIT batch resume scanning
+        except ImportError:
+            _jit_scan_kernel = False
+        else:
+            prange = numba.prange
+            _jit_scan_kernel = numba.njit(parallel=True, cache=True)(_scan_kernel)
+    return _jit_scan_kernel or None
+
+
+# Static catalogs are built once at import and shared, read-only, by every instance
+_DSA_PROBLEMS = MappingProxyType({
+    'easy': (
+        Problem('Two Sum', 'Array', 'Easy'),
+        Problem('Valid Parentheses', 'Stack', 'Easy'),
+        Problem('Merge Two Sorted Lists', 'Linked List', 'Easy')
+    ),
+    'medium': (
+        Problem('LRU Cache', 'Design', 'Medium'),
+        Problem('Binary Tree Level Order', 'Tree', 'Medium'),
+        Problem('Longest Substring', 'String', 'Medium')
+    ),
+    'hard': (
+        Problem('Median of Two Sorted Arrays', 'Binary Search', 'Hard'),
+        Problem('Word Ladder II', 'Graph', 'Hard')
+    )
+})
+
+
+def _index_by_topic(problems: tuple) -> MappingProxyType:
+    by_topic = {}
+    for problem in problems:
+        by_topic.setdefault(problem.topic.lower(), []).append(problem)
+    return MappingProxyType({topic: tuple(items) for topic, items in by_topic.items()})
+
+
+# level -> lowercased topic -> problems, so topic filtering is a dict lookup
+_DSA_BY_LEVEL_TOPIC = MappingProxyType({
+    level: _index_by_topic(problems) for level, problems in _DSA_PROBLEMS.items()
+})
+
+
 class DSAProblemRecommender:
     """Custom tool to recommend DSA problems based on student level"""
     
+    __slots__ = ('problems', '_by_level_topic', '_cached_recommend')
+    
     def __init__(self):
-        self.problems = {
-            'easy': [
-                {'name': 'Two Sum', 'topic': 'Array', 'difficulty': 'Easy'},
-                {'name': 'Valid Parentheses', 'topic': 'Stack', 'difficulty': 'Easy'},
-                {'name': 'Merge Two Sorted Lists', 'topic': 'Linked List', 'difficulty': 'Easy'}
-            ],
-            'medium': [
-                {'name': 'LRU Cache', 'topic': 'Design', 'difficulty': 'Medium'},
-                {'name': 'Binary Tree Level Order', 'topic': 'Tree', 'difficulty': 'Medium'},
-                {'name': 'Longest Substring', 'topic': 'String', 'difficulty': 'Medium'}
-            ],
-            'hard': [
-                {'name': 'Median of Two Sorted Arrays', 'topic': 'Binary Search', 'difficulty': 'Hard'},
-                {'name': 'Word Ladder II', 'topic': 'Graph', 'difficulty': 'Hard'}
-            ]
-        }
+        self.problems = _DSA_PROBLEMS
+        self._by_level_topic = _DSA_BY_LEVEL_TOPIC
+        # Per-instance memoization over the immutable shared catalog
+        self._cached_recommend = lru_cache(maxsize=64)(self._filter_problems)
         logger.info("DSA Problem Recommender initialized")
     
-    def recommend(self, level: str, topic: str = None) -> List[Dict]:
-        problems = self.problems.get(level.lower(), [])
+    def _filter_problems(self, level: str, topic: str = None) -> tuple:
         if topic:
-            problems = [p for p in problems if p['topic'].lower() == topic.lower()]
-        logger.info(f"Recommended {len(problems)} problems for level: {level}")
-        return problems
+            return self._by_level_topic.get(level, {}).get(topic, ())
+        return self.problems.get(level, ())
+    
+    def cache_info(self):
+        return self._cached_recommend.cache_info()
+    
+    def recommend(self, level: str, topic: str = None) -> List['Problem']:
+        problems = self._cached_recommend(level.lower(), topic.lower() if topic else None)
+        if logger.isEnabledFor(logging.INFO):
+            cache = self._cached_recommend.cache_info()
+            logger.info("Recommended %d problems for level: %s (cache hits=%d, misses=%d)",
+                        len(problems), level, cache.hits, cache.misses)
+        return list(problems)
+
+
+_ATS_KEYWORDS = MappingProxyType({
+    'technical_skills': ('python', 'java', 'c++', 'javascript', 'sql', 'react', 'aws', 'docker', 'kubernetes'),
+    'soft_skills': ('leadership', 'communication', 'teamwork', 'problem-solving', 'analytical'),
+    'action_verbs': ('developed', 'implemented', 'designed', 'optimized', 'led', 'managed', 'created')
+})
+# Tokenize once and match keywords by set intersection (whole tokens only,
+# so 'java' no longer matches inside 'javascript')
+_TOKEN_RE = re.compile(r"[a-z0-9+#.\-]+")
+_ATS_KW_SETS = MappingProxyType({cat: frozenset(kws) for cat, kws in _ATS_KEYWORDS.items()})
+_ATS_KW_RANK = MappingProxyType({
+    cat: MappingProxyType({kw: i for i, kw in enumerate(kws)}) for cat, kws in _ATS_KEYWORDS.items()
+})
+# Flattened (category, keyword) columns shared by the batch paths
+_ATS_KW_FLAT = tuple((cat, kw) for cat, kws in _ATS_KEYWORDS.items() for kw in kws)
+_ATS_KW_ARRAY = _ATS_KW_TECH_MASK = _ATS_KW_BUF = _ATS_KW_OFFSETS = None
+if np is not None:
+    _ATS_KW_ARRAY = np.asarray([kw for _, kw in _ATS_KW_FLAT])
+    _ATS_KW_TECH_MASK = np.asarray([cat == 'technical_skills' for cat, _ in _ATS_KW_FLAT])
+    # Space-delimited keyword bytes + offsets for the batch scan kernel
+    _encoded = [f" {kw} ".encode('utf-8') for _, kw in _ATS_KW_FLAT]
+    _ATS_KW_BUF = np.frombuffer(b''.join(_encoded), dtype=np.uint8)
+    _ATS_KW_OFFSETS = np.zeros(len(_encoded) + 1, dtype=np.int64)
+    np.cumsum([len(kw) for kw in _encoded], out=_ATS_KW_OFFSETS[1:])
+    del _encoded
+    for _array in (_ATS_KW_ARRAY, _ATS_KW_TECH_MASK, _ATS_KW_OFFSETS):
+        _array.flags.writeable = False
+    del _array
 
 
 class ResumeAnalyzer:
     """Analyzes resumes and provides optimization suggestions"""
     
+    __slots__ = ('ats_keywords', '_token_re', '_kw_sets', '_kw_rank', '_kw_flat',
+                 '_kw_buf', '_kw_offsets', '_kw_array', '_kw_tech_mask')
+    
     def __init__(self):
-        self.ats_keywords = {
-            'technical_skills': ['python', 'java', 'c++', 'javascript', 'sql', 'react', 'aws', 'docker', 'kubernetes'],
-            'soft_skills': ['leadership', 'communication', 'teamwork', 'problem-solving', 'analytical'],
-            'action_verbs': ['developed', 'implemented', 'designed', 'optimized', 'led', 'managed', 'created']
-        }
+        self.ats_keywords = _ATS_KEYWORDS
+        self._token_re = _TOKEN_RE
+        self._kw_sets = _ATS_KW_SETS
+        self._kw_rank = _ATS_KW_RANK
+        self._kw_flat = _ATS_KW_FLAT
+        self._kw_array = _ATS_KW_ARRAY
+        self._kw_tech_mask = _ATS_KW_TECH_MASK
+        self._kw_buf = _ATS_KW_BUF
+        self._kw_offsets = _ATS_KW_OFFSETS
         logger.info("Resume Analyzer initialized")
     
-    def analyze(self, resume_text: str, target_role: str = "Software Engineer") -> Dict:
+    def _tokenize(self, resume_text: str) -> set:
+        """Lowercased token set shared by analyze and both batch paths"""
+        tokens = set()
+        for token in self._token_re.findall(resume_text.lower()):
+            # Trailing periods come from sentence punctuation, not the skill itself
+            token = token.rstrip('.')
+            tokens.add(token)
+            if '-' in token:
+                # Keep 'problem-solving' whole, but let 'python-based' match 'python' too
+                tokens.update(part for part in token.split('-') if part)
+        return tokens
+    
+    def _match_keywords(self, tokens: set) -> Dict[str, List[str]]:
+        return {
+            cat: sorted(kw_set & tokens, key=self._kw_rank[cat].__getitem__)
+            for cat, kw_set in self._kw_sets.items()
+        }
+    
+    def _build_analysis(self, found: Dict[str, List[str]], ats_score: int = None) -> Dict:
         analysis = {
             'ats_score': 0,
-            'keyword_analysis': {},
+            'keyword_analysis': found,
             'suggestions': [],
             'strengths': []
         }
         
-        resume_lower = resume_text.lower()
-        
-        # Check technical skills
-        found_tech = [skill for skill in self.ats_keywords['technical_skills'] if skill in resume_lower]
-        analysis['keyword_analysis']['technical_skills'] = found_tech
+        found_tech = found['technical_skills']
         if found_tech:
             analysis['strengths'].append(f"Found {len(found_tech)} relevant technical skills")
         
         # Calculate ATS score
-        analysis['ats_score'] = min(100, len(found_tech) * 5 + 20)
+        if ats_score is None:
+            ats_score = min(100, len(found_tech) * 5 + 20)
+        analysis['ats_score'] = ats_score
         
         # Generate suggestions
         if len(found_tech) < 5:
             analysis['suggestions'].append("Add more technical skills relevant to the role")
         
-        logger.info(f"Resume analyzed. ATS Score: {analysis['ats_score']}")
         return analysis
+    
+    def analyze(self, resume_text: str, target_role: str = "Software Engineer") -> Dict:
+        # Check all keyword categories in one tokenization pass
+        analysis = self._build_analysis(self._match_keywords(self._tokenize(resume_text)))
+        
+        logger.info("Resume analyzed. ATS Score: %d", analysis['ats_score'])
+        return analysis
+    
+    def analyze_batch(self, resumes: List[str], target_role: str = "Software Engineer") -> List[Dict]:
+        """Analyze many resumes at once, using the Numba kernel when available"""
+        scan_kernel = _get_jit_scan_kernel() if np is not None else None
+        if scan_kernel is None:
+            return [self.analyze(resume, target_role) for resume in resumes]
+        
+        # Space-delimited token strings, so a ' kw ' substring hit is a whole-token match
+        encoded = [f" {' '.join(self._tokenize(resume))} ".encode('utf-8') for resume in resumes]
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(resume) for resume in encoded], out=offsets[1:])
+        
+        hits = np.zeros((len(encoded), len(self._kw_flat)), dtype=np.int8)
+        if len(buf):
+            scan_kernel(buf, offsets, self._kw_buf, self._kw_offsets, hits)
+        
+        analyses = self._analyses_from_hits(hits.tolist())
+        logger.info("Batch analyzed %d resumes", len(analyses))
+        return analyses
+    
+    def analyze_batch_numpy(self, resumes: List[str], target_role: str = "Software Engineer") -> List[Dict]:
+        """Analyze many resumes via a NumPy hit matrix and one vectorized ATS-score reduction"""
+        if np is None:
+            return [self.analyze(resume, target_role) for resume in resumes]
+        
+        hits = np.zeros((len(resumes), self._kw_array.size), dtype=bool)
+        for i, resume in enumerate(resumes):
+            tokens = self._tokenize(resume)
+            if tokens:
+                hits[i] = np.isin(self._kw_array, list(tokens))
+        scores = np.minimum(100, (hits & self._kw_tech_mask).sum(axis=1) * 5 + 20)
+        
+        analyses = self._analyses_from_hits(hits.tolist(), scores.tolist())
+        logger.info("Batch analyzed %d resumes", len(analyses))
+        return analyses
+    
+    def _analyses_from_hits(self, hits: List[List], scores: List[int] = None) -> List[Dict]:
+        """Turn a (n_resumes, n_keywords) hit matrix over self._kw_flat into analysis dicts"""
+        analyses = []
+        for i, row in enumerate(hits):
+            found = {cat: [] for cat in self.ats_keywords}
+            for (cat, kw), hit in zip(self._kw_flat, row):
+                if hit:
+                    found[cat].append(kw)
+            analyses.append(self._build_analysis(found, None if scores is None else scores[i]))
+        return analyses
+
+
+_LEARNING_RESOURCES = MappingProxyType({
+    'dsa': (
+        Resource('LeetCode Patterns', 'Practice', 'Medium'),
+        Resource('Neetcode.io', 'Video + Practice', 'All levels'),
+    ),
+    'system_design': (
+        Resource('System Design Primer (GitHub)', 'Article', 'Beginner'),
+        Resource('ByteByteGo', 'Video', 'All levels')
+    )
+})
 
 
 class LearningResourceAgent:
     """Recommends learning resources based on student goals"""
     
+    __slots__ = ('resources', '_cached_recommend')
+    
     def __init__(self):
-        self.resources = {
-            'dsa': [
-                {'title': 'LeetCode Patterns', 'type': 'Practice', 'difficulty': 'Medium'},
-                {'title': 'Neetcode.io', 'type': 'Video + Practice', 'difficulty': 'All levels'},
-            ],
-            'system_design': [
-                {'title': 'System Design Primer (GitHub)', 'type': 'Article', 'difficulty': 'Beginner'},
-                {'title': 'ByteByteGo', 'type': 'Video', 'difficulty': 'All levels'}
-            ]
-        }
+        self.resources = _LEARNING_RESOURCES
+        # Per-instance memoization over the immutable shared catalog
+        self._cached_recommend = lru_cache(maxsize=64)(self._lookup_resources)
         logger.info("Learning Resource Agent initialized")
     
-    def recommend(self, topic: str, level: str = 'All levels') -> List[Dict]:
+    def _lookup_resources(self, topic_key: str) -> tuple:
+        return self.resources.get(topic_key, ())
+    
+    def cache_info(self):
+        return self._cached_recommend.cache_info()
+    
+    def recommend(self, topic: str, level: str = 'All levels') -> List['Resource']:
         topic_lower = topic.lower().replace(' ', '_')
-        resources = self.resources.get(topic_lower, [])
-        logger.info(f"Recommended {len(resources)} resources for {topic}")
-        return resources
+        resources = self._cached_recommend(topic_lower)
+        if logger.isEnabledFor(logging.INFO):
+            cache = self._cached_recommend.cache_info()
+            logger.info("Recommended %d resources for %s (cache hits=%d, misses=%d)",
+                        len(resources), topic, cache.hits, cache.misses)
+        return list(resources)
+
+
+# Weekly activities are identical for every week, so one immutable tuple is shared
+_DEFAULT_ACTIVITIES = ('Practice coding problems', 'Mock interviews', 'Resume review')
 
 
 class StudyPlannerAgent:
     """Creates customized study schedules"""
     
+    __slots__ = ()
+    
     def __init__(self):
         logger.info("Study Planner Agent initialized")
     
     def create_plan(self, weeks: int, focus_areas: List[str], hours_per_day: int = 4) -> Dict:
+        n_focus = len(focus_areas)
         plan = {
             'duration': f"{weeks} weeks",
             'daily_commitment': f"{hours_per_day} hours/day",
-            'weekly_schedule': [],
+            'weekly_schedule': [
+                {
+                    'week': week,
+                    'focus': focus_areas[(week - 1) % n_focus],
+                    'activities': _DEFAULT_ACTIVITIES
+                }
+                for week in range(1, weeks + 1)
+            ],
             'milestones': []
         }
         
-        for week in range(1, weeks + 1):
-            week_plan = {
-                'week': week,
-                'focus': focus_areas[(week - 1) % len(focus_areas)],
-                'activities': ['Practice coding problems', 'Mock interviews', 'Resume review']
-            }
-            plan['weekly_schedule'].append(week_plan)
-        
-        logger.info(f"Created {weeks}-week study plan")
+        logger.info("Created %d-week study plan", weeks)
         return plan
 
 
@@ -195,18 +904,125 @@ class StudyPlannerAgent:
 class CoordinatorAgent:
     """Main agent that routes queries to appropriate specialists"""
     
-    def __init__(self, memory_bank, dsa_tool, resume_analyzer, resource_agent, planner):
+    __slots__ = ('memory', 'dsa_tool', 'resume_analyzer', 'resource_agent', 'planner',
+                 'max_concurrency', '_semaphores', '_router', '_keyword_routes',
+                 '_dispatch')
+    
+    # Keyword -> route table; level keywords map to ('dsa', level) tuples
+    ROUTES = {
+        'dsa': ('problem', 'dsa', 'algorithm'),
+        'resume': ('resume', 'cv', 'ats'),
+        'resources': ('learn', 'resource', 'study material'),
+        'plan': ('plan', 'schedule', 'weeks'),
+        ('dsa', 'easy'): ('easy',),
+        ('dsa', 'hard'): ('hard',),
+    }
+    
+    # Route -> statements inlined into the generated _dispatch method; routes
+    # missing from ROUTES are left out of the generated body entirely. The
+    # current specialists are in-memory and fast, so they run inline via run();
+    # entry points that block (LLM/IO calls) should use run_blocking() instead.
+    DISPATCH = {
+        'dsa': (
+            "level = 'easy' if ('dsa', 'easy') in matched else 'hard' if ('dsa', 'hard') in matched else 'medium'",
+            "tasks['dsa_recommendations'] = run(self.dsa_tool.recommend, level=level)",
+        ),
+        'resume': (
+            "tasks['resume_analysis'] = run(self.resume_analyzer.analyze, 'Sample resume text')",
+        ),
+        'resources': (
+            "tasks['learning_resources'] = run(self.resource_agent.recommend, 'dsa')",
+        ),
+        'plan': (
+            "tasks['study_plan'] = run(self.planner.create_plan, 4, ['DSA', 'System Design'])",
+        ),
+    }
+    
+    def __init__(self, memory_bank, dsa_tool, resume_analyzer, resource_agent, planner,
+                 max_concurrency: int = 4):
         self.memory = memory_bank
         self.dsa_tool = dsa_tool
         self.resume_analyzer = resume_analyzer
         self.resource_agent = resource_agent
         self.planner = planner
+        # Caps concurrent blocking specialist calls across all queries on an event
+        # loop (guards future rate-limited LLM calls); one semaphore per running loop
+        self.max_concurrency = max_concurrency
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._build_router()
+        self._build_dispatch()
         logger.info("Coordinator Agent initialized with all specialist agents")
     
-    def process_query(self, student_id: str, query: str) -> Dict:
-        logger.info(f"Processing query for student {student_id}")
+    def _build_dispatch(self):
+        """Generate a straight-line _dispatch(matched) for the configured routes"""
+        lines = [
+            'def _dispatch(self, matched):',
+            '    tasks = {}',
+            '    run = self._run_specialist',
+            '    run_blocking = self._run_blocking',
+        ]
+        for route, statements in self.DISPATCH.items():
+            if route not in self.ROUTES:
+                continue
+            lines.append(f'    if {route!r} in matched:')
+            lines.extend('        ' + statement for statement in statements)
+        lines.append('    return tasks')
+        namespace = {}
+        exec(compile('\n'.join(lines), f'<{type(self).__name__}._dispatch>', 'exec'), namespace)
+        self._dispatch = types.MethodType(namespace['_dispatch'], self)
+    
+    def _build_router(self):
+        """Compile ROUTES into a single automaton scanned once per query"""
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for route, keywords in self.ROUTES.items():
+                for keyword in keywords:
+                    # Keep all routes sharing a keyword
+                    routes = automaton.get(keyword, ()) + (route,)
+                    automaton.add_word(keyword, routes)
+            automaton.make_automaton()
+            self._router = automaton
+            self._keyword_routes = None
+        else:
+            # Fallback: one compiled regex; the lookahead reports overlapping hits
+            keyword_routes = {}
+            for route, keywords in self.ROUTES.items():
+                for keyword in keywords:
+                    keyword_routes.setdefault(keyword, []).append(route)
+            # The alternation reports only the longest keyword at each position, so
+            # each keyword also carries the routes of every keyword that prefixes it
+            self._keyword_routes = {
+                keyword: [route for other, routes in keyword_routes.items()
+                          if keyword.startswith(other) for route in routes]
+                for keyword in keyword_routes
+            }
+            keywords = sorted(keyword_routes, key=len, reverse=True)
+            self._router = re.compile('(?=(%s))' % '|'.join(map(re.escape, keywords)))
+    
+    def _match_routes(self, query_lower: str) -> Set:
+        if self._keyword_routes is None:
+            return {route for _, routes in self._router.iter(query_lower) for route in routes}
+        return {route for match in self._router.finditer(query_lower)
+                for route in self._keyword_routes[match.group(1)]}
+    
+    def _specialist_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+    
+    async def _run_specialist(self, func, *args, **kwargs):
+        # Cheap, GIL-bound specialists: a thread hop would cost far more than the call
+        return func(*args, **kwargs)
+    
+    async def _run_blocking(self, func, *args, **kwargs):
+        async with self._specialist_semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def process_query(self, student_id: str, query: str) -> Dict:
+        logger.info("Processing query for student %s", student_id)
         
-        context = self.memory.get_student_context(student_id)
         query_lower = query.lower()
         
         response = {
@@ -216,39 +1032,42 @@ class CoordinatorAgent:
             'summary': ''
         }
         
-        # Route to appropriate agents
-        if any(word in query_lower for word in ['problem', 'dsa', 'algorithm']):
-            level = 'medium'
-            if 'easy' in query_lower:
-                level = 'easy'
-            elif 'hard' in query_lower:
-                level = 'hard'
-            
-            problems = self.dsa_tool.recommend(level=level)
-            response['results']['dsa_recommendations'] = problems
-        
-        if any(word in query_lower for word in ['resume', 'cv', 'ats']):
-            analysis = self.resume_analyzer.analyze("Sample resume text")
-            response['results']['resume_analysis'] = analysis
-        
-        if any(word in query_lower for word in ['learn', 'resource', 'study material']):
-            resources = self.resource_agent.recommend('dsa')
-            response['results']['learning_resources'] = resources
+        # Route to appropriate agents; matched specialists run in parallel
+        tasks = self._dispatch(self._match_routes(query_lower))
         
-        if any(word in query_lower for word in ['plan', 'schedule', 'weeks']):
-            weeks = 4
-            plan = self.planner.create_plan(weeks, ['DSA', 'System Design'])
-            response['results']['study_plan'] = plan
+        if tasks:
+            keys, coros = zip(*tasks.items())
+            results = await asyncio.gather(*coros)
+            response['results'].update(zip(keys, results))
         
         response['summary'] = "Here are your personalized recommendations."
         
         self.memory.update_progress(
             student_id,
             'query',
-            {'question': query, 'timestamp': datetime.now().isoformat()}
+            {'question': query}
         )
         
         return response
+    
+    def process_query_sync(self, student_id: str, query: str) -> Dict:
+        """Synchronous wrapper around process_query for non-async callers"""
+        return asyncio.run(self.process_query(student_id, query))
+    
+    async def process_queries(self, items: List[tuple], max_concurrency: int = 16) -> List[Dict]:
+        """Process (student_id, query) pairs concurrently, returning results in submission order"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _one(index: int, student_id: str, query: str):
+            async with semaphore:
+                return index, await self.process_query(student_id, query)
+        
+        tagged = await asyncio.gather(*[
+            _one(index, student_id, query) for index, (student_id, query) in enumerate(items)
+        ])
+        tagged.sort(key=lambda pair: pair[0])
+        logger.info("Processed batch of %d queries", len(tagged))
+        return [response for _, response in tagged]
 
 
 #====================================================================================
@@ -256,12 +1075,21 @@ class CoordinatorAgent:
 #====================================================================================
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Student Career Assistant multi-agent demo")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="JSONL file of {\"student_id\", \"query\"[, \"profile\"]} records to process as a cohort")
+    parser.add_argument('--db', metavar='PATH',
+                        help="Persist the memory bank to this sqlite3 database")
+    parser.add_argument('--eviction', choices=sorted(EVICTION_POLICIES), default='lru',
+                        help="Memory bank eviction policy (default: lru)")
+    args = parser.parse_args()
+    
     print("\n" + "="*80)
     print("🚀 STUDENT CAREER ASSISTANT - MULTI-AGENT SYSTEM")
     print("="*80)
     
     # Initialize all agents
-    memory_bank = StudentMemoryBank()
+    memory_bank = StudentMemoryBank(db_path=args.db, policy=EVICTION_POLICIES[args.eviction]())
     dsa_tool = DSAProblemRecommender()
     resume_analyzer = ResumeAnalyzer()
     resource_agent = LearningResourceAgent()
@@ -276,17 +1104,42 @@ if __name__ == "__main__":
     print("   • Comprehensive logging (Observability)")
     print("   • Production-ready architecture")
     
-    # Demo
-    memory_bank.add_student("student_001", {
-        'name': 'Sai Ganesh',
-        'year': '3rd Year',
-        'major': 'CS/AI-ML'
-    })
-    
-    query = "I have an interview in 3 weeks. Can you help me prepare?"
-    result = coordinator.process_query("student_001", query)
+    if args.batch:
+        # Batch demo: fan out a cohort of queries
+        items = []
+        with open(args.batch) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if 'profile' in record:
+                    memory_bank.add_student(record['student_id'], record['profile'])
+                items.append((record['student_id'], record['query']))
+        
+        results = asyncio.run(coordinator.process_queries(items))
+        
+        print(f"\n\n📋 Batch: {len(results)} queries from {args.batch}")
+        for result in results:
+            print(f"\n🎯 {result['student_id']}: {result['query']}")
+            print(_dumps(result['results']))
+        print("\n" + "="*80 + "\n")
+    else:
+        # Demo
+        memory_bank.add_student("student_001", {
+            'name': 'Sai Ganesh',
+            'year': '3rd Year',
+            'major': 'CS/AI-ML'
+        })
+        
+        query = "I have an interview in 3 weeks. Can you help me prepare?"
+        result = coordinator.process_query_sync("student_001", query)
+        
+        print(f"\n\n📋 Demo Query: {query}")
+        print(f"\n🎯 Results:")
+        print(_dumps(result['results']))
+        print("\n" + "="*80 + "\n")
     
-    print(f"\n\n📋 Demo Query: {query}")
-    print(f"\n🎯 Results:")
-    print(json.dumps(result['results'], indent=2))
-    print("\n" + "="*80 + "\n")
+    logger.info("Memory bank eviction stats: %s", memory_bank.policy.stats())
+    logger.info("Cache stats: dsa=%s, resources=%s",
+                dsa_tool.cache_info(), resource_agent.cache_info())
+    memory_bank.close()
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import agent
+from agent import (
+    CoordinatorAgent, DSAProblemRecommender, LearningResourceAgent, ResumeAnalyzer,
+    StudentMemoryBank, StudyPlannerAgent,
+)
+
+
+class SlowRecommender(DSAProblemRecommender):
+    """Records how many recommend calls run at once"""
+    
+    __slots__ = ('active', 'peak', 'lock')
+    
+    def __init__(self):
+        super().__init__()
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+    
+    def recommend(self, level, topic=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return super().recommend(level, topic)
+
+
+def make_coordinator(dsa_tool=None, cls=CoordinatorAgent, **kwargs):
+    return cls(StudentMemoryBank(), dsa_tool or DSAProblemRecommender(), ResumeAnalyzer(),
+                            LearningResourceAgent(), StudyPlannerAgent(), **kwargs)
+
+
+class ProcessQueryTest(unittest.TestCase):
+    def test_routes_all_matched_specialists(self):
+        results = make_coordinator().process_query_sync('s1', 'hard dsa, my cv, learn and plan')['results']
+        self.assertEqual(set(results), {'dsa_recommendations', 'resume_analysis',
+                                        'learning_resources', 'study_plan'})
+        self.assertEqual({p.difficulty for p in results['dsa_recommendations']}, {'Hard'})
+    
+    def test_query_does_not_format_history(self):
+        coordinator = make_coordinator()
+        coordinator.memory.add_student('s1', {})
+        for i in range(10):
+            coordinator.memory.update_progress('s1', 'query', {'i': i})
+        with mock.patch('agent._fmt_ts', side_effect=AssertionError("history formatted")) as fmt_ts:
+            coordinator.process_query_sync('s1', 'dsa problems')
+        fmt_ts.assert_not_called()
+    
+    def test_concurrency_cap_is_shared_across_batch(self):
+        class BlockingCoordinator(CoordinatorAgent):
+            __slots__ = ()
+            DISPATCH = dict(CoordinatorAgent.DISPATCH, dsa=(
+                "tasks['dsa_recommendations'] = run_blocking(self.dsa_tool.recommend, level='medium')",
+            ))
+        
+        dsa_tool = SlowRecommender()
+        coordinator = BlockingCoordinator(StudentMemoryBank(), dsa_tool, ResumeAnalyzer(),
+                                          LearningResourceAgent(), StudyPlannerAgent(), max_concurrency=2)
+        items = [(f's{i}', 'dsa problems') for i in range(8)]
+        responses = asyncio.run(coordinator.process_queries(items))
+        self.assertEqual([r['student_id'] for r in responses], [sid for sid, _ in items])
+        self.assertTrue(all(r['results']['dsa_recommendations'] for r in responses))
+        self.assertEqual(dsa_tool.peak, 2)
+    
+    def test_cheap_specialists_run_inline(self):
+        with mock.patch('asyncio.to_thread', side_effect=AssertionError("thread hop")):
+            results = make_coordinator().process_query_sync('s1', 'dsa cv learn plan')['results']
+        self.assertEqual(len(results), 4)
+
+
+class PrefixCoordinator(CoordinatorAgent):
+    __slots__ = ()
+    ROUTES = dict(CoordinatorAgent.ROUTES, resources=('learn', 'resource', 'planning'))
+
+
+ROUTING_QUERIES = [
+    'easy dsa and hard plan, cv',
+    'I have an interview in 3 weeks',
+    'study material for algorithm problems',
+    'planning my resume',
+    'nothing relevant',
+]
+
+
+class RouterTest(unittest.TestCase):
+    def test_regex_fallback_reports_prefix_keywords(self):
+        with mock.patch.object(agent, 'ahocorasick', None):
+            coordinator = make_coordinator(cls=PrefixCoordinator)
+        self.assertEqual(coordinator._match_routes('planning'), {'plan', 'resources'})
+    
+    def test_regex_fallback_matches_automaton(self):
+        if agent.ahocorasick is None:
+            self.skipTest("pyahocorasick not installed")
+        for cls in (CoordinatorAgent, PrefixCoordinator):
+            automaton = make_coordinator(cls=cls)
+            with mock.patch.object(agent, 'ahocorasick', None):
+                fallback = make_coordinator(cls=cls)
+            for query in ROUTING_QUERIES:
+                with self.subTest(cls=cls.__name__, query=query):
+                    self.assertEqual(fallback._match_routes(query), automaton._match_routes(query))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from agent import EVICTION_POLICIES, LFUPolicy, LRUPolicy, StudentMemoryBank, TinyLFUPolicy
+
+
+class LRUPolicyTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        policy = LRUPolicy()
+        for key in 'abc':
+            policy.on_insert(key)
+        policy.on_hit('a')
+        self.assertEqual(policy.evict(), 'b')
+        self.assertEqual(policy.evict(), 'c')
+        self.assertEqual(policy.stats(), {'policy': 'lru', 'hits': 1, 'inserts': 3, 'evictions': 2})
+
+
+class LFUPolicyTest(unittest.TestCase):
+    def test_evicts_least_frequently_used(self):
+        policy = LFUPolicy()
+        for key in 'abc':
+            policy.on_insert(key)
+        policy.on_hit('a')
+        policy.on_hit('a')
+        policy.on_hit('c')
+        self.assertEqual(policy.evict(), 'b')
+        self.assertEqual(policy.evict(), 'c')
+        self.assertEqual(policy.evict(), 'a')
+    
+    def test_ties_go_to_least_recently_touched(self):
+        policy = LFUPolicy()
+        for key in 'ab':
+            policy.on_insert(key)
+        policy.on_hit('a')
+        policy.on_hit('b')
+        self.assertEqual(policy.evict(), 'a')
+    
+    def test_heap_compaction_keeps_counts(self):
+        policy = LFUPolicy()
+        policy.on_insert('hot')
+        policy.on_insert('cold')
+        for _ in range(500):
+            policy.on_hit('hot')
+        self.assertLess(len(policy._heap), 100)
+        self.assertEqual(policy.evict(), 'cold')
+
+
+class TinyLFUPolicyTest(unittest.TestCase):
+    def test_frequent_student_survives_one_hit_wonders(self):
+        policy = TinyLFUPolicy()
+        tracked = set()
+        for key in ('hot', 'warm'):
+            policy.on_insert(key)
+            tracked.add(key)
+        for _ in range(5):
+            policy.on_hit('hot')
+        for i in range(20):
+            # Bank of capacity 2: evict before every new insert
+            tracked.discard(policy.evict())
+            policy.on_insert(f'new{i}')
+            tracked.add(f'new{i}')
+        self.assertIn('hot', tracked)
+        self.assertEqual(len(tracked), 2)
+
+
+class MemoryBankPolicyTest(unittest.TestCase):
+    def test_bank_stays_bounded_under_every_policy(self):
+        rng = random.Random(1)
+        for name, policy_cls in EVICTION_POLICIES.items():
+            with self.subTest(policy=name):
+                bank = StudentMemoryBank(max_students=10, policy=policy_cls())
+                for _ in range(500):
+                    student_id = f's{rng.randrange(50)}'
+                    if not bank.get_student_context(student_id):
+                        bank.add_student(student_id, {})
+                    self.assertLessEqual(len(bank.students), 10)
+                stats = bank.policy.stats()
+                self.assertEqual(stats['policy'], name)
+                self.assertEqual(stats['inserts'] - stats['evictions'], len(bank.students))
+
+
+if __name__ == '__main__':
+    unittest.main()
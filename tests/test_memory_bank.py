@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+
+from agent import StudentMemoryBank
+
+
+class LimitsTest(unittest.TestCase):
+    def test_rejects_non_positive_limits(self):
+        for kwargs in ({'max_students': 0}, {'max_students': -1}, {'max_progress': 0}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    StudentMemoryBank(**kwargs)
+
+
+class ProgressPoolTest(unittest.TestCase):
+    def test_context_is_not_aliased_to_pooled_entries(self):
+        bank = StudentMemoryBank(max_progress=3, pool_size=4)
+        bank.add_student('s1', {})
+        for i in range(3):
+            bank.update_progress('s1', 'query', {'i': i})
+        before = bank.get_student_context('s1')['progress']
+        for i in range(3, 6):
+            bank.update_progress('s1', 'query', {'i': i})
+        self.assertEqual([p['details'] for p in before], [{'i': 0}, {'i': 1}, {'i': 2}])
+        after = bank.get_student_context('s1')['progress']
+        self.assertEqual([p['details'] for p in after], [{'i': 3}, {'i': 4}, {'i': 5}])
+
+    
+    def test_pooled_entries_drop_evicted_details(self):
+        bank = StudentMemoryBank(max_students=1)
+        bank.add_student('s1', {})
+        bank.update_progress('s1', 'query', {'secret': 1})
+        bank.add_student('s2', {})
+        self.assertTrue(all(entry.details is None and entry.activity is None for entry in bank._pool))
+
+
+class StudentContextTest(unittest.TestCase):
+    def test_context_has_iso_timestamps(self):
+        bank = StudentMemoryBank()
+        bank.add_student('s1', {'name': 'A'})
+        bank.update_progress('s1', 'query', {'question': 'q'})
+        context = bank.get_student_context('s1')
+        self.assertEqual(set(context), {'profile', 'progress', 'preferences', 'created_at'})
+        datetime.fromisoformat(context['created_at'])
+        entry, = context['progress']
+        self.assertEqual((entry['activity'], entry['details']), ('query', {'question': 'q'}))
+        datetime.fromisoformat(entry['timestamp'])
+    
+    def test_unknown_student(self):
+        self.assertEqual(StudentMemoryBank().get_student_context('missing'), {})
+
+
+class PersistenceTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'bank.db')
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def open_bank(self, **kwargs):
+        bank = StudentMemoryBank(db_path=self.db_path, flush_interval=60, **kwargs)
+        self.addCleanup(bank.close)
+        return bank
+    
+    def test_survives_restart(self):
+        bank = self.open_bank()
+        bank.add_student('s1', {'name': 'A'})
+        bank.update_progress('s1', 'query', {'i': 1})
+        bank.close()
+        context = self.open_bank().get_student_context('s1')
+        self.assertEqual(context['profile'], {'name': 'A'})
+        self.assertEqual([p['details'] for p in context['progress']], [{'i': 1}])
+    
+    def test_evicted_student_reloads_from_disk(self):
+        bank = self.open_bank(max_students=1, max_progress=2)
+        bank.add_student('s1', {'name': 'A'})
+        for i in range(3):
+            bank.update_progress('s1', 'query', {'i': i})
+        bank.add_student('s2', {'name': 'B'})
+        self.assertNotIn('s1', bank.students)
+        context = bank.get_student_context('s1')
+        self.assertEqual([p['details'] for p in context['progress']], [{'i': 1}, {'i': 2}])
+    
+    def test_failed_flush_rolls_back_and_keeps_rows(self):
+        bank = self.open_bank()
+        bank.add_student('s1', {})
+        bank.update_progress('s1', 'query', {'i': 1})
+        bad_row = ('s1', 'query')
+        bank._write_buf.append(bad_row)
+        with self.assertRaises(sqlite3.Error):
+            bank.flush()
+        self.assertFalse(bank.db.in_transaction)
+        self.assertEqual(len(bank._write_buf), 2)
+        bank._write_buf.remove(bad_row)
+        bank.add_student('s2', {})
+        (count,), = bank.db.execute('SELECT COUNT(*) FROM progress').fetchall()
+        self.assertEqual(count, 1)
+    
+    def test_unknown_lookups_do_not_force_flushes(self):
+        bank = self.open_bank()
+        bank.add_student('s1', {})
+        for i in range(10):
+            bank.update_progress('s1', 'query', {'i': i})
+            self.assertEqual(bank.get_student_context(f'unknown{i % 2}'), {})
+            bank.update_progress(f'unknown{i % 2}', 'query', {'i': i})
+        self.assertEqual(len(bank._write_buf), 10)
+        (count,), = bank.db.execute('SELECT COUNT(*) FROM progress').fetchall()
+        self.assertEqual(count, 0)
+    
+    def test_add_student_clears_negative_cache(self):
+        bank = self.open_bank(max_students=1)
+        self.assertEqual(bank.get_student_context('s1'), {})
+        bank.add_student('s1', {'name': 'A'})
+        bank.add_student('s2', {})
+        self.assertNotIn('s1', bank.students)
+        self.assertEqual(bank.get_student_context('s1')['profile'], {'name': 'A'})
+    
+    def test_unserializable_details_leave_memory_unchanged(self):
+        bank = self.open_bank()
+        bank.add_student('s1', {})
+        with self.assertRaises(TypeError):
+            bank.update_progress('s1', 'query', {'bad': object()})
+        self.assertEqual(bank.get_student_context('s1')['progress'], [])
+        self.assertEqual(bank._write_buf, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
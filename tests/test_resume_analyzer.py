@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import unittest
+
+from agent import ResumeAnalyzer
+
+
+RESUMES = [
+    "Developed JavaScript apps in C++ and Python. Led teamwork, problem-solving.",
+    "Java, SQL and AWS; designed react front ends on docker/kubernetes.",
+    "",
+    "Nothing relevant here.",
+    "Python-based ETL, AWS-certified, cross-team leadership.",
+]
+
+
+class KeywordMatchTest(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = ResumeAnalyzer()
+    
+    def keywords(self, resume):
+        return self.analyzer.analyze(resume)['keyword_analysis']
+    
+    def test_whole_tokens_only(self):
+        self.assertEqual(self.keywords("Built JavaScript tooling")['technical_skills'], ['javascript'])
+    
+    def test_hyphenated_tokens_match_their_parts(self):
+        found = self.keywords("Python-based pipelines, AWS-certified, strong problem-solving.")
+        self.assertEqual(found['technical_skills'], ['python', 'aws'])
+        self.assertEqual(found['soft_skills'], ['problem-solving'])
+
+
+class BatchAnalysisTest(unittest.TestCase):
+    def setUp(self):
+        self.analyzer = ResumeAnalyzer()
+        self.expected = [self.analyzer.analyze(resume) for resume in RESUMES]
+    
+    def test_analyze_batch_matches_analyze(self):
+        self.assertEqual(self.analyzer.analyze_batch(RESUMES), self.expected)
+    
+    def test_analyze_batch_numpy_matches_analyze(self):
+        self.assertEqual(self.analyzer.analyze_batch_numpy(RESUMES), self.expected)
+    
+    def test_numba_not_imported_until_batch(self):
+        code = "import sys, agent; print('numba' in sys.modules)"
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()
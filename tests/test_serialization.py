@@ -0,0 +1,23 @@
+import unittest
+from unittest import mock
+
+import agent
+
+
+class DumpsTest(unittest.TestCase):
+    PAYLOAD = {'query': 'Résumé für 日本', 'problems': list(agent.DSAProblemRecommender().recommend('easy'))}
+    
+    def test_stdlib_fallback_matches_orjson(self):
+        if agent.orjson is None:
+            self.skipTest("orjson not installed")
+        expected = agent._dumps(self.PAYLOAD)
+        with mock.patch.object(agent, 'orjson', None):
+            self.assertEqual(agent._dumps(self.PAYLOAD), expected)
+    
+    def test_non_ascii_is_emitted_verbatim(self):
+        with mock.patch.object(agent, 'orjson', None):
+            self.assertIn('Résumé für 日本', agent._dumps(self.PAYLOAD))
+
+
+if __name__ == '__main__':
+    unittest.main()